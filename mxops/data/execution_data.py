@@ -6,12 +6,13 @@ This module contains the functions to load, write and update scenario data
 
 from __future__ import annotations
 from copy import deepcopy
-from dataclasses import asdict, dataclass, field, is_dataclass
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import lru_cache
 import os
 from pathlib import Path
 import re
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mxpyserializer.abi_serializer import AbiSerializer
 
@@ -28,6 +29,29 @@ from mxops.utils.logger import get_logger
 
 LOGGER = get_logger("data")
 
+# This regex captures:
+# - words, possibly including hyphens
+# - numbers within square brackets
+VALUE_KEY_TOKEN_PATTERN = re.compile(r"([\w\-]+)|\[(\d+)\]")
+
+
+@lru_cache(maxsize=4096)
+def _parse_value_key_cached(path: str) -> Tuple[int | str, ...]:
+    """
+    Parse a value key string into keys and indices using regex.
+    The same keys are parsed many times during an execution, hence the cache.
+    The result is a tuple so that the cached value can not be modified
+
+    :param path: value key to parse
+    :type path: str
+    :return: keys and indices of the value key
+    :rtype: Tuple[int | str, ...]
+    """
+    return tuple(
+        int(match.group(2)) if match.group(2) else match.group(1)
+        for match in VALUE_KEY_TOKEN_PATTERN.finditer(path)
+    )
+
 
 def parse_value_key(path) -> List[int | str]:
     """
@@ -35,14 +59,7 @@ def parse_value_key(path) -> List[int | str]:
 
     e.g. "key_1.key2[2].data" -> ['key_1', 'key2', 2, 'data']
     """
-    # This regex captures:
-    # - words, possibly including hyphens
-    # - numbers within square brackets
-    pattern = r"([\w\-]+)|\[(\d+)\]"
-    tokens = re.findall(pattern, path)
-
-    # Flatten the list and convert indices to int
-    return [int(index) if index else key for key, index in tokens]
+    return list(_parse_value_key_cached(path))
 
 
 @dataclass(kw_only=True)
@@ -214,11 +231,16 @@ class ContractData(SavedValuesData):
         :return: this instance as a dictionary
         :rtype: Dict
         """
-        self_dict = asdict(self)
-        if self.serializer is None:
-            self_dict["serializer"] = None
-        else:
-            self_dict["serializer"] = self.serializer.to_dict()
+        # asdict would deepcopy the serializer only to replace it afterward
+        self_dict = {}
+        for data_field in fields(self):
+            if data_field.name == "serializer":
+                if self.serializer is None:
+                    self_dict["serializer"] = None
+                else:
+                    self_dict["serializer"] = self.serializer.to_dict()
+            else:
+                self_dict[data_field.name] = deepcopy(getattr(self, data_field.name))
         # add attribute to indicate internal/external
         self_dict["is_external"] = isinstance(self, ExternalContractData)
         return self_dict
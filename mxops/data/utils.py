@@ -40,7 +40,6 @@ def decode_bytes(data: Any) -> Any:
     :return: decoded or raw data
     :rtype: Any
     """
-    print(data)
     if isinstance(data, str) and data.startswith("bytes:"):
         base64_encoded = data[6:]  # Remove 'bytes:' prefix
         return base64.b64decode(base64_encoded)
@@ -49,7 +48,8 @@ def decode_bytes(data: Any) -> Any:
 
 def custom_decoder(item: Any) -> Dict:
     """
-    Custom decoded to use when calling json.load
+    Custom decoder to apply on data loaded from json. It walks recursively
+    through the data, so it should be called once on the whole loaded data
 
     :param item: data to decode
     :type item: Any
@@ -93,8 +93,9 @@ def json_dumps(obj: Any) -> str:
 
 def json_load(file_path: Path) -> Any:
     """
-    Small wrapper arount json.load that uses the custom decoder
-
+    Small wrapper arount json.load that uses the custom decoder.
+    The decoder is applied in a single pass once the data is loaded: as an
+    object_hook, it would walk again through every nested dictionary.
 
     :param file_path: path of the data to load
     :type file_path: Path
@@ -102,7 +103,7 @@ def json_load(file_path: Path) -> Any:
     :rtype: Any
     """
     with open(file_path.as_posix(), "r", encoding="utf-8") as file:
-        return json.load(file, object_hook=custom_decoder)
+        return custom_decoder(json.load(file))
 
 
 def json_loads(obj_str: str) -> Any:
@@ -115,4 +116,4 @@ def json_loads(obj_str: str) -> Any:
     :return: loaded data
     :rtype: Any
     """
-    return json.loads(obj_str, object_hook=custom_decoder)
+    return custom_decoder(json.loads(obj_str))
@@ -5,12 +5,12 @@ This module contains the classes used to check on-chain transactions
 """
 from dataclasses import dataclass
 import sys
-from typing import Dict, List, Literal
+from typing import Dict, List, Literal, Tuple
 
 from multiversx_sdk_network_providers.transactions import TransactionOnNetwork
 
 from mxops import errors
-from mxops.execution.msc import ExpectedTransfer
+from mxops.execution.msc import ExpectedTransfer, OnChainTransfer
 from mxops.execution.network import get_on_chain_transfers, raise_on_errors
 from mxops.utils.logger import get_logger
 
@@ -18,7 +18,7 @@ from mxops.utils.logger import get_logger
 LOGGER = get_logger("Checks")
 
 
-@dataclass
+@dataclass(slots=True)
 class Check:
     """
     Represents a check to operate on the content of an on-chain transaction
@@ -52,7 +52,7 @@ class Check:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class SuccessCheck(Check):
     """
     Check that an on-chain transaction is successful
@@ -71,7 +71,7 @@ class SuccessCheck(Check):
         return True
 
 
-@dataclass
+@dataclass(slots=True)
 class TransfersCheck(Check):
     """
     Check the transfers that an on-chain transaction contains specified transfers
@@ -116,20 +116,32 @@ class TransfersCheck(Check):
         :rtype: bool
         """
         onchain_transfers = get_on_chain_transfers(onchain_tx, self.include_gas_refund)
+        # group the on-chain transfers by key to match each expected transfer
+        # with a single lookup
+        onchain_by_key: Dict[Tuple[str, str, str, str], List[OnChainTransfer]] = {}
+        for transfer in onchain_transfers:
+            onchain_by_key.setdefault(transfer.canonical_key(), []).append(transfer)
         for expected_transfer in self.expected_transfers:
-            try:
-                i_tr = onchain_transfers.index(expected_transfer)
-            except ValueError:
+            matching_transfers = onchain_by_key.get(expected_transfer.canonical_key())
+            if not matching_transfers:
                 evaluated_transfer = expected_transfer.get_dynamic_evaluated()
+                remaining_transfers = [
+                    transfer
+                    for transfers in onchain_by_key.values()
+                    for transfer in transfers
+                ]
                 LOGGER.error(
                     (
                         f"Expected transfer found no match:\n{evaluated_transfer} "
-                        f"Remaining on-chain transfers:\n{onchain_transfers}"
+                        f"Remaining on-chain transfers:\n{remaining_transfers}"
                     )
                 )
                 return False
-            onchain_transfers.pop(i_tr)
+            matching_transfers.pop()
 
+        onchain_transfers = [
+            transfer for transfers in onchain_by_key.values() for transfer in transfers
+        ]
         if self.condition == "exact" and len(onchain_transfers) > 0:
             LOGGER.error(
                 (
@@ -5,14 +5,14 @@ Various elements for the execution sub package
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple, Union
 
 from mxops.execution import utils
 from mxops.utils import msc
 
 
-@dataclass
+@dataclass(slots=True)
 class EsdtTransfer:
     """
     Represent any type of ESDT transfer (Simple ESDT, NFT, SFT, MetaESDT)
@@ -23,31 +23,52 @@ class EsdtTransfer:
     nonce: int = 0
 
 
-@dataclass
+@dataclass(frozen=True)
 class OnChainTransfer:
     """
-    Represent any type of token transfer on chain
+    Represent any type of token transfer on chain.
+    Instances are immutable, as their canonical key is computed at initialisation
     """
 
     sender: str
     receiver: str
     token_identifier: str
     amount: str
+    _canonical_key: Tuple[str, str, str, str] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """
+        Compute the canonical key of the transfer
+        """
+        object.__setattr__(
+            self,
+            "_canonical_key",
+            (self.sender, self.receiver, self.token_identifier, str(self.amount)),
+        )
+
+    def canonical_key(self) -> Tuple[str, str, str, str]:
+        """
+        Return the tuple that identifies this transfer. Two transfers are equal
+        if and only if they have the same canonical key.
+        The key is computed once at initialisation.
+
+        :return: sender, receiver, token identifier and amount of the transfer
+        :rtype: Tuple[str, str, str, str]
+        """
+        return self._canonical_key
 
     def __eq__(self, other: Any) -> bool:
-        if isinstance(other, ExpectedTransfer):
-            return other == self
-        if isinstance(other, OnChainTransfer):
-            return (self.sender, self.receiver, self.token_identifier, self.amount) == (
-                other.sender,
-                other.receiver,
-                other.token_identifier,
-                other.amount,
-            )
+        if isinstance(other, (ExpectedTransfer, OnChainTransfer)):
+            return self.canonical_key() == other.canonical_key()
         raise NotImplementedError
 
+    def __hash__(self) -> int:
+        return hash(self._canonical_key)
 
-@dataclass
+
+@dataclass(slots=True)
 class ExpectedTransfer:
     """
     Holds the information of a transfert that is expected to be found in an on-chain
@@ -102,22 +123,24 @@ class ExpectedTransfer:
             amount=amount,
         )
 
-    def __eq__(self, other: Any) -> bool:
+    def canonical_key(self) -> Tuple[str, str, str, str]:
+        """
+        Evaluate dynamically this instance and return the tuple that identifies
+        the resulting transfer. Two transfers are equal if and only if they have
+        the same canonical key
+
+        :return: sender, receiver, token identifier and amount of the transfer
+        :rtype: Tuple[str, str, str, str]
+        """
         evaluated_self = self.get_dynamic_evaluated()
-        if isinstance(other, OnChainTransfer):
-            evaluated_other = other
-        elif isinstance(other, ExpectedTransfer):
-            evaluated_other = other.get_dynamic_evaluated()
-        else:
-            raise NotImplementedError
         return (
             evaluated_self.sender,
             evaluated_self.receiver,
             evaluated_self.token_identifier,
             str(evaluated_self.amount),
-        ) == (
-            evaluated_other.sender,
-            evaluated_other.receiver,
-            evaluated_other.token_identifier,
-            str(evaluated_other.amount),
         )
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (ExpectedTransfer, OnChainTransfer)):
+            return self.canonical_key() == other.canonical_key()
+        raise NotImplementedError
@@ -3,21 +3,28 @@ author: Etienne Wallet
 
 This module contains the functions to execute a scene in a scenario
 """
+from copy import deepcopy
 from dataclasses import dataclass, field
 import os
 from pathlib import Path
 import re
 from typing import Dict, List, Union
 
-from mxpyserializer.abi_serializer import AbiSerializer
 import yaml
 
 from mxops.config.config import Config
 from mxops.data.execution_data import _ScenarioData, ExternalContractData, ScenarioData
 from mxops.execution.steps import LoopStep, SceneStep, Step, instanciate_steps
 from mxops.execution.account import AccountsManager
+from mxops.execution.utils import load_abi_serializer
 from mxops import errors
 from mxops.utils.logger import get_logger
+from mxops.utils.msc import cache_by_modification_time
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml is not available
+    from yaml import SafeLoader
 
 
 LOGGER = get_logger("scene")
@@ -48,19 +55,33 @@ class Scene:
             self.steps = instanciate_steps(self.steps)
 
 
+@cache_by_modification_time(maxsize=128)
+def _parse_scene_file(path: Path) -> Dict:
+    """
+    Parse the content of a scene file
+
+    :param path: path of the scene file
+    :type path: Path
+    :return: raw content of the scene file
+    :rtype: Dict
+    """
+    with open(path.as_posix(), "r", encoding="utf-8") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
 def load_scene(path: Path) -> Scene:
     """
-    Load a scene file and convert its content into a list
+    Load a scene file and convert its content into a list.
+    A scene executed several times (from loops or scene steps) is parsed only once
 
     :param path: _description_
     :type path: Path
     :return: _description_
     :rtype: List[Step]
     """
-    with open(path.as_posix(), "r", encoding="utf-8") as file:
-        raw_scene = yaml.safe_load(file)
-
-    return Scene(**raw_scene)
+    raw_scene = _parse_scene_file(path)
+    # the instantiation of the steps consumes the raw data
+    return Scene(**deepcopy(raw_scene))
 
 
 def execute_scene(scene_path: Path):
@@ -108,7 +129,7 @@ def execute_scene(scene_path: Path):
             contract_data = {"address": contract_data}
         address = contract_data["address"]
         try:
-            serializer = AbiSerializer.from_abi(Path(contract_data["abi_path"]))
+            serializer = load_abi_serializer(Path(contract_data["abi_path"]))
         except KeyError:
             serializer = None
         try:
@@ -12,6 +12,7 @@ import os
 from pathlib import Path
 import sys
 import time
+from types import ModuleType
 from typing import Any, ClassVar, Dict, Iterator, List, Optional, Set, Union
 
 from multiversx_sdk_cli.contracts import QueryResult
@@ -52,7 +53,7 @@ from mxops.execution.msc import EsdtTransfer
 from mxops.execution.network import send, send_and_wait_for_result
 from mxops.execution.utils import parse_query_result
 from mxops.utils.logger import get_logger
-from mxops.utils.msc import get_file_hash, get_tx_link
+from mxops.utils.msc import cache_by_modification_time, get_file_hash, get_tx_link
 from mxops import errors
 
 LOGGER = get_logger("steps")
@@ -237,7 +238,7 @@ class ContractDeployStep(TransactionStep):
             pass
 
         if self.abi_path is not None:
-            serializer = AbiSerializer.from_abi(Path(self.abi_path))
+            serializer = utils.load_abi_serializer(Path(self.abi_path))
         else:
             serializer = None
 
@@ -283,7 +284,7 @@ class ContractDeployStep(TransactionStep):
             raise errors.ParsingError(on_chain_tx, "contract deployment address")
 
         if self.abi_path is not None:
-            serializer = AbiSerializer.from_abi(Path(self.abi_path))
+            serializer = utils.load_abi_serializer(Path(self.abi_path))
         else:
             serializer = None
 
@@ -326,7 +327,7 @@ class ContractUpgradeStep(TransactionStep):
         LOGGER.info(f"Upgrading contract {self.contract}")
 
         if self.abi_path is not None:
-            serializer = AbiSerializer.from_abi(Path(self.abi_path))
+            serializer = utils.load_abi_serializer(Path(self.abi_path))
         else:
             serializer = None
 
@@ -365,7 +366,7 @@ class ContractUpgradeStep(TransactionStep):
             raise ValueError("On chain transaction is None")
 
         if self.abi_path is not None:
-            serializer = AbiSerializer.from_abi(Path(self.abi_path))
+            serializer = utils.load_abi_serializer(Path(self.abi_path))
         else:
             serializer = None
 
@@ -1408,6 +1409,22 @@ class MultiTransfersStep(TransactionStep):
         )
 
 
+@cache_by_modification_time(maxsize=32)
+def _load_user_module(module_path: Path) -> ModuleType:
+    """
+    Load a user module from its path
+
+    :param module_path: path of the python file of the module
+    :type module_path: Path
+    :return: loaded module
+    :rtype: ModuleType
+    """
+    spec = spec_from_file_location(module_path.stem, module_path.as_posix())
+    user_module = module_from_spec(spec)
+    spec.loader.exec_module(user_module)
+    return user_module
+
+
 @dataclass
 class PythonStep(Step):
     """
@@ -1429,10 +1446,8 @@ class PythonStep(Step):
             f"Executing python function {self.function} from user module {module_name}"
         )
 
-        # load module and function
-        spec = spec_from_file_location(module_name, module_path.as_posix())
-        user_module = module_from_spec(spec)
-        spec.loader.exec_module(user_module)
+        # load module and function, the module is executed only once per version
+        user_module = _load_user_module(module_path)
         user_function = getattr(user_module, self.function)
 
         # transform args and kwargs and execute
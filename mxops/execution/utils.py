@@ -3,17 +3,35 @@ author: Etienne Wallet
 
 This module contains some utilities functions for the execution sub package
 """
+from functools import lru_cache
 import os
+from pathlib import Path
 from typing import Any, List, Optional, Tuple
 
 from multiversx_sdk_cli.contracts import QueryResult, SmartContract
 from multiversx_sdk_core.address import Address
 from multiversx_sdk_core.errors import ErrBadAddress
+from mxpyserializer.abi_serializer import AbiSerializer
 
 from mxops.config.config import Config
 from mxops.data.execution_data import ScenarioData
 from mxops import errors
 from mxops.execution.account import AccountsManager
+from mxops.utils.msc import cache_by_modification_time
+
+
+@cache_by_modification_time(maxsize=64)
+def load_abi_serializer(abi_path: Path) -> AbiSerializer:
+    """
+    Load the serializer of an ABI file. Each file is parsed only once as long as
+    it is not modified, so the returned instance is shared and must not be mutated
+
+    :param abi_path: path of the ABI file
+    :type abi_path: Path
+    :return: serializer of the ABI
+    :rtype: AbiSerializer
+    """
+    return AbiSerializer.from_abi(abi_path)
 
 
 def retrieve_specified_type(arg: str) -> Tuple[str, Optional[str]]:
@@ -253,6 +271,21 @@ def get_contract_instance(contract_str: str) -> SmartContract:
     raise errors.ParsingError(contract_str, "contract address")
 
 
+@lru_cache(maxsize=1024)
+def _address_from_bech32(bech32_address: str) -> Address:
+    """
+    Decode a bech32 address. Scenes use the same few addresses over and over and
+    the decoding is costly, so each address is decoded only once.
+    The returned instance is shared and must not be mutated
+
+    :param bech32_address: address to decode
+    :type bech32_address: str
+    :return: address instance
+    :rtype: Address
+    """
+    return Address.from_bech32(bech32_address)
+
+
 def get_address_instance(address_str: str) -> Address:
     """
     From a string return an Address instance.
@@ -269,14 +302,14 @@ def get_address_instance(address_str: str) -> Address:
 
     # try to see if the string is a valid address
     try:
-        return Address.from_bech32(evaluated_address_str)
+        return _address_from_bech32(evaluated_address_str)
     except ErrBadAddress:
         pass
 
     # else try to see if it is a valid contract id
     try:
         evaluated_address_str = retrieve_value_from_string(f"%{address_str}.address")
-        return Address.from_bech32(evaluated_address_str)
+        return _address_from_bech32(evaluated_address_str)
     except (ErrBadAddress, errors.WrongDataKeyPath):
         pass
 
@@ -4,13 +4,18 @@ author: Etienne Wallet
 This module contains utils various functions
 """
 from configparser import NoOptionError
+from functools import lru_cache, wraps
 import hashlib
 from pathlib import Path
 import time
+from typing import Callable, TypeVar
 
 from mxops.config.config import Config
 
 
+T = TypeVar("T")
+
+
 def get_explorer_tx_link(tx_hash: str) -> str:
     """
     Return the link to a transaction using the explorer in the config
@@ -90,6 +95,38 @@ def int_to_pair_hex(number: int) -> str:
     return hex_str
 
 
+def cache_by_modification_time(
+    maxsize: int,
+) -> Callable[[Callable[[Path], T]], Callable[[Path], T]]:
+    """
+    Create a decorator that caches the result of a function loading a file.
+    The cache is keyed on the resolved path of the file and on its modification
+    time, so that a file modified during an execution is loaded again.
+    The cached results are shared between calls and must not be mutated
+
+    :param maxsize: maximum number of results to keep in the cache
+    :type maxsize: int
+    :return: decorator to apply on the loading function
+    :rtype: Callable[[Callable[[Path], T]], Callable[[Path], T]]
+    """
+
+    def decorator(load_function: Callable[[Path], T]) -> Callable[[Path], T]:
+        @lru_cache(maxsize=maxsize)
+        def cached_load(file_path: str, _modification_time: int) -> T:
+            return load_function(Path(file_path))
+
+        @wraps(load_function)
+        def wrapper(file_path: Path) -> T:
+            resolved_path = Path(file_path).resolve()
+            return cached_load(
+                resolved_path.as_posix(), resolved_path.stat().st_mtime_ns
+            )
+
+        return wrapper
+
+    return decorator
+
+
 class RateThrottler:
     """
     This class represent a rate throttler
@@ -1,12 +1,21 @@
+import copy
+import json
 from pathlib import Path
+import pickle
+import time
+from typing import Dict
+
 import pytest
 from unittest.mock import patch
 
 from multiversx_sdk_network_providers.network_config import NetworkConfig
+from multiversx_sdk_network_providers.transactions import TransactionOnNetwork
+from mxpyserializer.abi_serializer import AbiSerializer
 
 from mxops.config.config import Config
 from mxops.data.execution_data import (
     InternalContractData,
+    _ScenarioData,
     ScenarioData,
     delete_scenario_data,
 )
@@ -44,15 +53,60 @@ def mock_network_config():
         yield
 
 
+@pytest.fixture(scope="session")
+def test_data_folder_path() -> Path:
+    return (Path(__file__).parent / "data").resolve()
+
+
+@pytest.fixture(scope="session")
+def api_responses_bytes(test_data_folder_path: Path) -> Dict[str, bytes]:
+    """
+    Read once all the api responses files so that tests don't have to hit the disk
+    """
+    return {
+        path.stem: path.read_bytes()
+        for path in (test_data_folder_path / "api_responses").glob("*.json")
+    }
+
+
+@pytest.fixture(scope="session")
+def api_transactions(
+    api_responses_bytes: Dict[str, bytes]
+) -> Dict[str, TransactionOnNetwork]:
+    """
+    Parse once all the api responses into on-chain transactions.
+    Tests must not modify the returned transactions as they are shared
+    """
+    return {
+        name: TransactionOnNetwork.from_proxy_http_response(**json.loads(raw_tx))
+        for name, raw_tx in api_responses_bytes.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def adder_serializer(test_data_folder_path: Path) -> AbiSerializer:
+    """
+    Parse once the ABI of the adder contract
+    """
+    return AbiSerializer.from_abi(test_data_folder_path / "abis" / "adder.abi.json")
+
+
 @pytest.fixture(scope="session", autouse=True)
-def test_data_folder_path():
-    return Path("./tests/data")
+def data_folder_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Redirect the MxOps data folder to a temporary directory, so that the tests
+    neither touch the user data nor collide with each other
+    """
+    data_path = tmp_path_factory.mktemp("mxops_data")
+    with patch("mxops.data.path.get_data_path", return_value=data_path):
+        yield data_path
 
 
 @pytest.fixture(scope="session", autouse=True)
-def scenario_data():
+def scenario_data(data_folder_path: Path):
+    scenario_name = "pytest_scenario"
     initialize_data_folder()
-    ScenarioData.create_scenario("pytest_scenario")
+    ScenarioData.create_scenario(scenario_name)
     contract_id = "my_test_contract"
     address = "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t"
     wasm_hash = "5ce403a4f73701481cc15b2378cdc5bce3e35fa215815aa5eb9104d9f7ab2451"
@@ -70,7 +124,7 @@ def scenario_data():
     )
 
     yield _scenario_data
-    delete_scenario_data("pytest_scenario", ask_confirmation=False)
+    delete_scenario_data(scenario_name, ask_confirmation=False)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -82,3 +136,42 @@ def accounts_manager():
     accounts_manager.load_account(
         "test_user_B", pem_path="./tests/data/test_user_B.pem"
     )
+
+
+@pytest.fixture(scope="session")
+def scenario_data_snapshot(scenario_data: _ScenarioData) -> bytes:
+    """
+    Pickle once the test scenario as built by the session setup
+    """
+    return pickle.dumps(scenario_data)
+
+
+@pytest.fixture(autouse=True)
+def restore_global_state(
+    scenario_data: _ScenarioData, scenario_data_snapshot: bytes, accounts_manager
+):
+    """
+    Put back the loaded accounts and the content of the test scenario after each
+    test, so that the mutations of a test don't leak into others
+    """
+    accounts = copy.copy(AccountsManager._accounts)
+    yield
+    AccountsManager._accounts.clear()
+    AccountsManager._accounts.update(accounts)
+    ScenarioData._instance = scenario_data
+    scenario_data.__dict__.update(pickle.loads(scenario_data_snapshot).__dict__)
+
+
+@pytest.fixture
+def in_memory_scenario_data() -> _ScenarioData:
+    """
+    Fresh scenario that is neither loaded from nor saved to the disk, for the tests
+    that only work on in-memory data
+    """
+    current_timestamp = int(time.time())
+    return _ScenarioData(
+        "__MXOPS_TEST_IN_MEMORY_SCENARIO",
+        NetworkEnum.LOCAL,
+        current_timestamp,
+        current_timestamp,
+    )
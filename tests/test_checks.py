@@ -1,5 +1,8 @@
-import json
-from pathlib import Path
+import dataclasses
+from itertools import combinations
+from typing import Dict
+
+import pytest
 
 from multiversx_sdk_cli.accounts import Account, Address
 from multiversx_sdk_network_providers.transactions import TransactionOnNetwork
@@ -11,6 +14,41 @@ from mxops.execution.checks import TransfersCheck
 from mxops.execution.msc import ExpectedTransfer, OnChainTransfer
 
 
+OWNER_BECH32 = "erd1zzugxvypryhfym7qrnnkxvrlh8d9ylw2s0399q5tzp43g297plcq4p6d30"
+OWNER_ADDRESS = Address(
+    bytes.fromhex("10b8833081192e926fc01ce763307fb9da527dca83e252828b106b1428be0ff0"),
+    "erd",
+)
+PING_PONG_BECH32 = "erd1qqqqqqqqqqqqqpgqpxkd9qgyyxykq5l6d8v9zud99hpwh7l0plcq3dae77"
+
+ADD_LIQUIDITY_EXPECTED_TRANSFERS = [
+    ExpectedTransfer(
+        "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
+        "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
+        "WEGLD-bd4d79",
+        "2662383390769244262",
+    ),
+    ExpectedTransfer(
+        "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
+        "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
+        "RIDE-7d18e9",
+        "1931527217545745197301",
+    ),
+    ExpectedTransfer(
+        "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
+        "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
+        "EGLDRIDE-7bd51a",
+        "1224365948567992620",
+    ),
+    ExpectedTransfer(
+        "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
+        "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
+        "RIDE-7d18e9",
+        "37",
+    ),
+]
+
+
 def test_transfers_equality():
     # Given
     expected_transfers = [
@@ -95,31 +133,51 @@ def test_transfers_equality():
 
     # When
     # Then
+    expected_keys = {t.canonical_key() for t in expected_transfers}
+    onchain_keys = {t.canonical_key() for t in onchain_transfers}
+    assert expected_keys == onchain_keys
+
     for et, ot in zip(expected_transfers, onchain_transfers):
         assert et == ot
         assert ot == et
-        assert et in onchain_transfers
-        assert ot in expected_transfers
 
-    for i in range(len(expected_transfers)):
-        for j in range(i + 1, len(expected_transfers)):
-            assert expected_transfers[i] != expected_transfers[j]
-            assert onchain_transfers[i] != onchain_transfers[j]
+    assert len(expected_keys) == len(expected_transfers)
+    assert len(onchain_keys) == len(onchain_transfers)
+    for transfer_a, transfer_b in combinations(expected_transfers, 2):
+        assert transfer_a != transfer_b
+    for transfer_a, transfer_b in combinations(onchain_transfers, 2):
+        assert transfer_a != transfer_b
 
     assert expected_transfers == onchain_transfers
 
 
-def test_data_load_equality():
+def test_onchain_transfer_immutability():
     # Given
-    AccountsManager._accounts["owner"] = Account(
-        Address.from_bech32(
-            "erd1zzugxvypryhfym7qrnnkxvrlh8d9ylw2s0399q5tzp43g297plcq4p6d30"
-        )
+    transfer = OnChainTransfer(OWNER_BECH32, PING_PONG_BECH32, "tokenA", "15")
+    int_amount_transfer = OnChainTransfer(OWNER_BECH32, PING_PONG_BECH32, "tokenA", 15)
+
+    # When
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        transfer.amount = "16"
+
+    # Then
+    assert transfer.canonical_key() == (
+        OWNER_BECH32,
+        PING_PONG_BECH32,
+        "tokenA",
+        "15",
     )
+    assert transfer == int_amount_transfer
+    assert hash(transfer) == hash(int_amount_transfer)
+
+
+def test_data_load_equality():
+    # Given
+    AccountsManager._accounts["owner"] = Account(OWNER_ADDRESS)
     scenario = ScenarioData.get()
     contract_data = InternalContractData(
         contract_id="egld-ping-pong",
-        address="erd1qqqqqqqqqqqqqpgqpxkd9qgyyxykq5l6d8v9zud99hpwh7l0plcq3dae77",
+        address=PING_PONG_BECH32,
         serializer=None,
         saved_values={"PingAmount": 1000000000000000000},
         wasm_hash="1383133d22b8be01c4dc6dfda448dbf0b70ba1acb348a50dd3224b9c8bb21757",
@@ -137,8 +195,8 @@ def test_data_load_equality():
 
     on_chain_transfers = [
         OnChainTransfer(
-            sender="erd1zzugxvypryhfym7qrnnkxvrlh8d9ylw2s0399q5tzp43g297plcq4p6d30",
-            receiver="erd1qqqqqqqqqqqqqpgqpxkd9qgyyxykq5l6d8v9zud99hpwh7l0plcq3dae77",
+            sender=OWNER_BECH32,
+            receiver=PING_PONG_BECH32,
             token_identifier="EGLD",
             amount="1000000000000000000",
         )
@@ -151,62 +209,98 @@ def test_data_load_equality():
     assert index == 0
 
 
-def test_exact_add_liquidity_transfers_check(test_data_folder_path: Path):
+@pytest.mark.parametrize(
+    "condition, include_gas_refund, expected_result",
+    [
+        ("exact", False, True),
+        ("included", False, True),
+        ("exact", True, False),
+        ("included", True, True),
+    ],
+)
+def test_add_liquidity_transfers_check(
+    api_transactions: Dict[str, TransactionOnNetwork],
+    condition: str,
+    include_gas_refund: bool,
+    expected_result: bool,
+):
     # Given
-    with open(test_data_folder_path / "api_responses" / "add_liquidity.json") as file:
-        onchain_tx = TransactionOnNetwork.from_proxy_http_response(**json.load(file))
-
-    expected_transfers = [
-        ExpectedTransfer(
-            "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
-            "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
-            "WEGLD-bd4d79",
-            "2662383390769244262",
-        ),
-        ExpectedTransfer(
-            "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
-            "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
-            "RIDE-7d18e9",
-            "1931527217545745197301",
-        ),
-        ExpectedTransfer(
-            "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
-            "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
-            "EGLDRIDE-7bd51a",
-            "1224365948567992620",
-        ),
-        ExpectedTransfer(
-            "erd1qqqqqqqqqqqqqpgqav09xenkuqsdyeyy5evqyhuusvu4gl3t2jpss57g8x",
-            "erd1n775edthxhyrhntcutmqfspanmjvscumxuydmm83xumlahz75kfsgp62ss",
-            "RIDE-7d18e9",
-            "37",
-        ),
-    ]
+    onchain_tx = api_transactions["add_liquidity"]
+    transfer_check = TransfersCheck(
+        ADD_LIQUIDITY_EXPECTED_TRANSFERS,
+        condition=condition,
+        include_gas_refund=include_gas_refund,
+    )
 
     # When
-    transfer_check = TransfersCheck(expected_transfers, condition="exact")
-    exact_result = transfer_check.get_check_status(onchain_tx)
+    result = transfer_check.get_check_status(onchain_tx)
 
-    transfer_check = TransfersCheck(expected_transfers, condition="included")
-    include_result = transfer_check.get_check_status(onchain_tx)
+    # Then
+    assert result is expected_result
+    if not expected_result:
+        with pytest.raises(CheckFailed):
+            transfer_check.raise_on_failure(onchain_tx)
 
+
+@pytest.mark.parametrize(
+    "condition, expected_result",
+    [
+        ("exact", False),
+        ("included", True),
+    ],
+)
+def test_duplicated_onchain_transfers_check(
+    monkeypatch: pytest.MonkeyPatch, condition: str, expected_result: bool
+):
+    # Given
+    onchain_transfers = [
+        OnChainTransfer(OWNER_BECH32, PING_PONG_BECH32, "EGLD", "1000"),
+        OnChainTransfer(OWNER_BECH32, PING_PONG_BECH32, "EGLD", "1000"),
+    ]
+    monkeypatch.setattr(
+        "mxops.execution.checks.get_on_chain_transfers",
+        lambda onchain_tx, include_gas_refund: onchain_transfers,
+    )
     transfer_check = TransfersCheck(
-        expected_transfers, condition="exact", include_gas_refund=True
+        [ExpectedTransfer(OWNER_BECH32, PING_PONG_BECH32, "EGLD", 1000)],
+        condition=condition,
     )
-    refund_result = transfer_check.get_check_status(onchain_tx)
-    try:
-        transfer_check.raise_on_failure(onchain_tx)
-        raise RuntimeError("Above line should raise an error")
-    except CheckFailed:
-        pass
 
+    # When
+    result = transfer_check.get_check_status(TransactionOnNetwork())
+
+    # Then
+    assert result is expected_result
+
+
+@pytest.mark.parametrize("condition", ["exact", "included"])
+def test_duplicated_expected_transfers_check(
+    monkeypatch: pytest.MonkeyPatch,
+    caplog: pytest.LogCaptureFixture,
+    condition: str,
+):
+    # Given
+    onchain_transfers = [
+        OnChainTransfer(OWNER_BECH32, PING_PONG_BECH32, "EGLD", "1000"),
+        OnChainTransfer(PING_PONG_BECH32, OWNER_BECH32, "EGLD", "5"),
+    ]
+    monkeypatch.setattr(
+        "mxops.execution.checks.get_on_chain_transfers",
+        lambda onchain_tx, include_gas_refund: onchain_transfers,
+    )
     transfer_check = TransfersCheck(
-        expected_transfers, condition="included", include_gas_refund=True
+        [
+            ExpectedTransfer(OWNER_BECH32, PING_PONG_BECH32, "EGLD", "1000"),
+            ExpectedTransfer(OWNER_BECH32, PING_PONG_BECH32, "EGLD", "1000"),
+        ],
+        condition=condition,
     )
-    included_refund_result = transfer_check.get_check_status(onchain_tx)
+
+    # When
+    result = transfer_check.get_check_status(TransactionOnNetwork())
 
     # Then
-    assert exact_result
-    assert include_result
-    assert not refund_result
-    assert included_refund_result
+    assert result is False
+    assert "Expected transfer found no match" in caplog.text
+    assert str(onchain_transfers[1]) in caplog.text
+    assert str(onchain_transfers[0]) not in caplog.text.split("Remaining")[-1]
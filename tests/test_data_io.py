@@ -1,7 +1,7 @@
+import copy
 import json
 from pathlib import Path
-import time
-from typing import Any, List
+from typing import Any, Dict, List
 
 import pytest
 
@@ -15,111 +15,127 @@ from mxops.data.execution_data import (
     TokenData,
     parse_value_key,
 )
+from mxops.data.utils import json_dump, json_load, json_loads
 from mxops.enums import NetworkEnum, TokenTypeEnum
 
 
-@pytest.mark.parametrize(
-    "scenario_path",
-    [
-        Path("tests/data/scenarios/scenario_A.json"),
-        Path("tests/data/scenarios/scenario_B.json"),
+SCENARIOS_FOLDER_PATH = Path(__file__).parent / "data" / "scenarios"
+SAVED_VALUES_TEMPLATE = {
+    "key_1": {
+        "key_2": [
+            {"data": "wrong value"},
+            {"data": "wrong value"},
+            {"data": "desired value"},
+        ]
+    }
+}
+EXPECTED_TUTORIAL_CONTRACTS_DATA = {
+    "egld-ping-pong": InternalContractData(
+        contract_id="egld-ping-pong",
+        address="erd1qqqqqqqqqqqqqpgq0048vv3uk6l6cdreezpallvduy4qnfv2plcq74464k",
+        serializer=None,
+        saved_values={},
+        wasm_hash="5ce403a4f73701481cc15b2378cdc5bce3e35fa215815aa5eb9104d9f7ab2451",
+        deploy_time=1677134892,
+        last_upgrade_time=1677134892,
+    )
+}
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        pytest.param(SCENARIOS_FOLDER_PATH / "scenario_A.json", id="scenario_A"),
+        pytest.param(SCENARIOS_FOLDER_PATH / "scenario_B.json", id="scenario_B"),
     ],
 )
-def test_scenario_loading(scenario_path: Path):
+def loaded_scenario(request: pytest.FixtureRequest) -> _ScenarioData:
+    """
+    Load once each of the scenarios that use a different environment syntax
+    """
+    return _ScenarioData.load_from_path(request.param)
+
+
+def test_scenario_loading(loaded_scenario: _ScenarioData):
     """
     Test that contract data is correctly loaded and that both environment syntax are
     handeld
     """
     # Given
     # When
-    scenario = _ScenarioData.load_from_path(scenario_path)
+    scenario = loaded_scenario
 
     # Then
     assert scenario.network == NetworkEnum.DEV
     assert scenario.name == "___test_mxops_tutorial_first_scene"
-    assert scenario.contracts_data == {
-        "egld-ping-pong": InternalContractData(
-            contract_id="egld-ping-pong",
-            address="erd1qqqqqqqqqqqqqpgq0048vv3uk6l6cdreezpallvduy4qnfv2plcq74464k",
-            serializer=None,
-            saved_values={},
-            wasm_hash=(
-                "5ce403a4f73701481cc15b2378cdc5bce3e35fa215815aa5eb9104d9f7ab2451"
-            ),
-            deploy_time=1677134892,
-            last_upgrade_time=1677134892,
-        )
-    }
+    assert scenario.contracts_data == EXPECTED_TUTORIAL_CONTRACTS_DATA
 
 
-def test_key_path_fetch():
+@pytest.fixture(scope="module")
+def shared_saved_values() -> SavedValuesData:
+    """
+    Saved values built once for the tests that only read them
+    """
+    return SavedValuesData(saved_values=copy.deepcopy(SAVED_VALUES_TEMPLATE))
+
+
+@pytest.mark.parametrize(
+    "value_key, expected_result",
+    [
+        ("key_1.key_2[2].data", "desired value"),
+        ("key_1.key_2[0].data", "wrong value"),
+        ("key_1.key_2[1]", {"data": "wrong value"}),
+    ],
+)
+def test_key_path_fetch(
+    shared_saved_values: SavedValuesData, value_key: str, expected_result: Any
+):
     """
     Test that data is fetched correctly from a key path
     """
     # Given
-    saved_values = SavedValuesData(
-        saved_values={
-            "key_1": {
-                "key_2": [
-                    {"data": "wrong value"},
-                    {"data": "wrong value"},
-                    {"data": "desired value"},
-                ]
-            }
-        }
-    )
-
     # When
-    data = saved_values.get_value("key_1.key_2[2].data")
+    data = shared_saved_values.get_value(value_key)
 
     # Then
-    assert data == "desired value"
+    assert data == expected_result
 
 
-def test_key_path_fetch_errors():
-    """
-    Test that errors are correctly raise for wrong key path
-    """
-    # Given
-    saved_values = SavedValuesData(
-        saved_values={
-            "key_1": {
-                "key_2": [
-                    {"data": "wrong value"},
-                    {"data": "wrong value"},
-                    {"data": "desired value"},
-                ]
-            }
-        }
-    )
-
-    # When
-    try:
-        saved_values.get_value("key_3")
-        raise RuntimeError("An error should have been raised by the line above")
-    except errors.WrongDataKeyPath as err:
-        assert err.args == (
+@pytest.mark.parametrize(
+    "value_key, expected_message",
+    [
+        (
+            "key_3",
             "Wrong key 'key_3' in ['key_3'] for data element {'key_1': {'key_2': "
             "[{'data': "
             "'wrong value'}, {'data': 'wrong value'}, {'data': 'desired value'}]}}",
-        )
-    try:
-        saved_values.get_value("key_1.key_3")
-        raise RuntimeError("An error should have been raised by the line above")
-    except errors.WrongDataKeyPath as err:
-        assert err.args == (
+        ),
+        (
+            "key_1.key_3",
             "Wrong key 'key_3' in ['key_1', 'key_3'] for data element {'key_2': "
             "[{'data': 'wrong value'}, {'data': 'wrong value'}, {'data': "
             "'desired value'}]}",
-        )
-    try:
-        saved_values.get_value("key_1.key_2[4]")
-        raise RuntimeError("An error should have been raised by the line above")
-    except errors.WrongDataKeyPath as err:
-        assert err.args == (
+        ),
+        (
+            "key_1.key_2[4]",
             "Wrong index 4 in ['key_1', 'key_2', 4] for data element [{'data': "
             "'wrong value'}, {'data': 'wrong value'}, {'data': 'desired value'}]",
-        )
+        ),
+    ],
+)
+def test_key_path_fetch_errors(
+    shared_saved_values: SavedValuesData, value_key: str, expected_message: str
+):
+    """
+    Test that errors are correctly raise for wrong key path
+    """
+    # Given
+    # When
+    with pytest.raises(errors.WrongDataKeyPath) as err_info:
+        shared_saved_values.get_value(value_key)
+
+    # Then
+    assert err_info.value.args == (expected_message,)
 
 
 @pytest.mark.parametrize(
@@ -162,39 +178,27 @@ def test_key_path_set(key_path: str, value: Any):
     assert retrieved_value == value
 
 
-def test_key_path_set_errors():
+@pytest.mark.parametrize(
+    "key_path, expected_message_start",
+    [
+        ("", "Key path is empty"),
+        ("[1]", "Expected a tuple or a list but found {"),
+        ("key_1.key_2.key_3", "Expected a dict but found ["),
+    ],
+)
+def test_key_path_set_errors(key_path: str, expected_message_start: str):
     """
     Test that errors are correctly raise for wrong key path
     """
     # Given
-    saved_values = SavedValuesData(
-        saved_values={
-            "key_1": {
-                "key_2": [
-                    {"data": "wrong value"},
-                    {"data": "wrong value"},
-                    {"data": "desired value"},
-                ]
-            }
-        }
-    )
+    saved_values = SavedValuesData(saved_values=copy.deepcopy(SAVED_VALUES_TEMPLATE))
 
     # When
-    try:
-        saved_values.set_value("", "value")
-        raise RuntimeError("An error should have been raised by the line above")
-    except errors.WrongDataKeyPath as err:
-        assert err.args == ("Key path is empty",)
-    try:
-        saved_values.set_value("[1]", "value")
-        raise RuntimeError("An error should have been raised by the line above")
-    except errors.WrongDataKeyPath as err:
-        assert err.args[0].startswith("Expected a tuple or a list but found {")
-    try:
-        saved_values.set_value("key_1.key_2.key_3", "value")
-        raise RuntimeError("An error should have been raised by the line above")
-    except errors.WrongDataKeyPath as err:
-        assert err.args[0].startswith("Expected a dict but found [")
+    with pytest.raises(errors.WrongDataKeyPath) as err_info:
+        saved_values.set_value(key_path, "value")
+
+    # Then
+    assert err_info.value.args[0].startswith(expected_message_start)
 
 
 def test_token_data_loading():
@@ -202,7 +206,7 @@ def test_token_data_loading():
     Test that token data is correctly loaded
     """
     # Given
-    scenario_path = Path("tests/data/scenarios/scenario_C.json")
+    scenario_path = SCENARIOS_FOLDER_PATH / "scenario_C.json"
 
     # When
     scenario = _ScenarioData.load_from_path(scenario_path)
@@ -224,33 +228,29 @@ def test_io_unicity():
     Test the loading and writing are consistent
     """
     # Given
-    scenario_path = Path("tests/data/scenarios/scenario_D.json")
-    with open(scenario_path.as_posix(), encoding="utf-8") as file:
-        raw_data = json.load(file)
+    scenario_path = SCENARIOS_FOLDER_PATH / "scenario_D.json"
+    raw_bytes = scenario_path.read_bytes()
+    raw_data = json.loads(raw_bytes)
 
     # When
-    scenario = _ScenarioData.load_from_path(scenario_path)
+    scenario = _ScenarioData.from_dict(json_loads(raw_bytes.decode("utf-8")))
     scenario_dict = scenario.to_dict()
 
     # Then
     assert scenario_dict == raw_data
 
 
-def test_abiserializer_io():
+def test_abiserializer_io(
+    in_memory_scenario_data: _ScenarioData, adder_serializer: AbiSerializer
+):
     """
     Test that an AbiSerializer object is correctly loaded from ABI, saved and reloaded
     from Scenario data
     """
     # Given
-    current_timestamp = int(time.time())
-    scenario_data = _ScenarioData(
-        "__MXOPS_TEST_SCENARIO_ARBITRAGER_IO",
-        NetworkEnum.LOCAL,
-        current_timestamp,
-        current_timestamp,
-        {},
-    )
-    serializer = AbiSerializer.from_abi(Path("tests/data/abis/adder.abi.json"))
+    scenario_data = in_memory_scenario_data
+    current_timestamp = scenario_data.creation_time
+    serializer = adder_serializer
     contract_name = "contract-test"
     contract_data = InternalContractData(
         contract_id=contract_name,
@@ -275,3 +275,26 @@ def test_abiserializer_io():
         reloaded_scenario_data.contracts_data[contract_name].to_dict()
         == scenario_data.contracts_data[contract_name].to_dict()
     )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"key": "value", "bytes_value": b"\x00\x01", "list": [1, 2, 3]},
+        {"amount": 10**24, "nested": {"bytes_value": b"data"}},
+    ],
+)
+def test_json_dump_and_load(tmp_path: Path, data: Dict):
+    """
+    Test that data is dumped and reloaded identically, including bytes and
+    integers above 64 bits
+    """
+    # Given
+    file_path = tmp_path / "data.json"
+
+    # When
+    json_dump(file_path, data)
+    loaded_data = json_load(file_path)
+
+    # Then
+    assert loaded_data == data
@@ -1,4 +1,6 @@
-import os
+from pathlib import Path
+
+import pytest
 
 from multiversx_sdk_cli.accounts import Account
 from multiversx_sdk_cli.contracts import SmartContract
@@ -9,6 +11,11 @@ from mxops.execution import utils
 from mxops.execution.account import AccountsManager
 
 
+ALICE_ADDRESS = Address.from_bech32(
+    "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
+)
+
+
 def test_no_type():
     # Given
     arg = "MyTokenIdentifier"
@@ -33,11 +40,11 @@ def test_int_type():
     assert specified_type == "int"
 
 
-def test_env_value():
+def test_env_value(monkeypatch: pytest.MonkeyPatch):
     # Given
     var_name = "PYTEST_MXOPS_VALUE"
     var_value = 784525
-    os.environ[var_name] = str(var_value)
+    monkeypatch.setenv(var_name, str(var_value))
 
     # When
     retrieved_value = utils.retrieve_value_from_env(f"${var_name}:int")
@@ -87,11 +94,8 @@ def test_value_from_config():
 
 def test_address_from_account():
     # Given
-    address = Address.from_bech32(
-        "erd1qyu5wthldzr8wx5c9ucg8kjagg0jfs53s8nr3zpz3hypefsdd8ssycr6th"
-    )
     account_name = "alice"
-    account = Account(address)
+    account = Account(ALICE_ADDRESS)
     AccountsManager._accounts[account_name] = account
 
     # When
@@ -99,7 +103,7 @@ def test_address_from_account():
     retrieved_value = utils.retrieve_address_from_account(arg)
 
     # Then
-    assert retrieved_value == address
+    assert retrieved_value == ALICE_ADDRESS
 
 
 def test_get_contract_instance():
@@ -134,3 +138,35 @@ def test_retrieve_contract_address():
     # Assert
     assert isinstance(address, str)
     address == "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t"
+
+
+def test_load_abi_serializer(test_data_folder_path: Path):
+    """
+    Test that an ABI file is parsed once and that its serializer is shared
+    """
+    # Given
+    abi_path = test_data_folder_path / "abis" / "adder.abi.json"
+
+    # When
+    serializer = utils.load_abi_serializer(abi_path)
+    serializer_bis = utils.load_abi_serializer(abi_path)
+
+    # Then
+    assert serializer is serializer_bis
+    assert list(serializer.endpoints.keys()) == ["getSum", "upgrade", "add", "init"]
+
+
+def test_get_address_instance_cache():
+    """
+    Test that a bech32 address is decoded once and shared
+    """
+    # Given
+    bech32_address = "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t"
+
+    # When
+    address = utils.get_address_instance(bech32_address)
+    address_bis = utils.get_address_instance("%my_test_contract.address")
+
+    # Then
+    assert address.bech32() == bech32_address
+    assert address is address_bis
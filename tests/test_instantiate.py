@@ -1,11 +1,11 @@
+import os
 from pathlib import Path
-import yaml
 
 from mxpyserializer.abi_serializer import AbiSerializer
 
 from mxops.data.execution_data import ScenarioData
 from mxops.execution.checks import SuccessCheck
-from mxops.execution.scene import Scene, execute_scene
+from mxops.execution.scene import execute_scene, load_scene
 from mxops.execution.steps import (
     ContractCallStep,
     ContractDeployStep,
@@ -16,11 +16,10 @@ from mxops.execution.steps import (
 
 def test_deploy_scene_instantiation(test_data_folder_path: Path):
     # Given
-    with open(test_data_folder_path / "deploy_scene.yaml", encoding="utf-8") as file:
-        deploy_yaml_content = yaml.safe_load(file)
+    scene_path = test_data_folder_path / "deploy_scene.yaml"
 
     # When
-    scene = Scene(**deploy_yaml_content)
+    scene = load_scene(scene_path)
     loaded_steps = scene.steps
 
     # Then
@@ -99,3 +98,32 @@ def test_abi_loading(test_data_folder_path: Path):
 
     # Then
     assert list(serializer.endpoints.keys()) == ["getSum", "upgrade", "add", "init"]
+
+
+def test_scene_reloading(tmp_path: Path):
+    """
+    Test that a scene loaded several times gives independent instances and that
+    a modified scene file is parsed again
+    """
+    # Given
+    scene_path = tmp_path / "scene.yaml"
+    scene_content = (
+        "allowed_networks:\n  - localnet\nallowed_scenario:\n  - .*\n"
+        "steps:\n  - type: Scene\n    scene_path: first_scene.yaml\n"
+    )
+    scene_path.write_text(scene_content, encoding="utf-8")
+
+    # When
+    first_scene = load_scene(scene_path)
+    second_scene = load_scene(scene_path)
+    scene_path.write_text(
+        scene_content.replace("first_scene", "second_scene"), encoding="utf-8"
+    )
+    modification_time = scene_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(scene_path, ns=(modification_time, modification_time))
+    modified_scene = load_scene(scene_path)
+
+    # Then
+    assert first_scene == second_scene
+    assert first_scene.steps[0] is not second_scene.steps[0]
+    assert modified_scene.steps[0].scene_path == "second_scene.yaml"
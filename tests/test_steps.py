@@ -1,4 +1,8 @@
 import os
+from pathlib import Path
+
+import pytest
+
 from mxops.data.execution_data import ScenarioData
 from mxops.execution.steps import PythonStep
 
@@ -37,6 +41,39 @@ def test_python_step():
     assert os_value_2 == "4582"
 
 
+def test_python_step_module_reloading(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that the module of a python step is loaded once and loaded again
+    when its file is modified
+    """
+    # Given
+    monkeypatch.setenv("PYTEST_MXOPS_MODULE_LOADS", "0")
+    module_path = tmp_path / "counting_module.py"
+    module_path.write_text(
+        "import os\n"
+        "loads = int(os.environ['PYTEST_MXOPS_MODULE_LOADS']) + 1\n"
+        "os.environ['PYTEST_MXOPS_MODULE_LOADS'] = str(loads)\n"
+        "\n\n"
+        "def do_nothing():\n"
+        "    pass\n",
+        encoding="utf-8",
+    )
+    step = PythonStep(module_path.as_posix(), "do_nothing")
+
+    # When
+    step.execute()
+    step.execute()
+    loads_before_modification = os.environ["PYTEST_MXOPS_MODULE_LOADS"]
+    modification_time = module_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(module_path, ns=(modification_time, modification_time))
+    step.execute()
+    loads_after_modification = os.environ["PYTEST_MXOPS_MODULE_LOADS"]
+
+    # Then
+    assert loads_before_modification == "1"
+    assert loads_after_modification == "2"
+
+
 def test_query_step():
     # Given
     pass
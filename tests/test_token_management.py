@@ -1,15 +1,13 @@
-import json
-from pathlib import Path
+from typing import Dict
 
 from multiversx_sdk_network_providers.transactions import TransactionOnNetwork
 
 from mxops.execution import token_management
 
 
-def test_token_identifier_extraction(test_data_folder_path: Path):
+def test_token_identifier_extraction(api_transactions: Dict[str, TransactionOnNetwork]):
     # Given
-    with open(test_data_folder_path / "api_responses" / "meta_issue.json") as file:
-        on_chain_tx = TransactionOnNetwork.from_proxy_http_response(**json.load(file))
+    on_chain_tx = api_transactions["meta_issue"]
 
     # When
     new_token_identifier = token_management.extract_new_token_identifier(on_chain_tx)
@@ -18,10 +16,9 @@ def test_token_identifier_extraction(test_data_folder_path: Path):
     assert new_token_identifier == "META-bdbf88"
 
 
-def test_nonce_extraction(test_data_folder_path: Path):
+def test_nonce_extraction(api_transactions: Dict[str, TransactionOnNetwork]):
     # Given
-    with open(test_data_folder_path / "api_responses" / "meta_nonce_mint.json") as file:
-        on_chain_tx = TransactionOnNetwork.from_proxy_http_response(**json.load(file))
+    on_chain_tx = api_transactions["meta_nonce_mint"]
 
     # When
     new_nonce = token_management.extract_new_nonce(on_chain_tx)
@@ -1,30 +1,36 @@
+import os
+from pathlib import Path
+
 from multiversx_sdk_core import Address
 import pytest
 
 from mxops.execution.utils import get_address_instance
+from mxops.utils.msc import cache_by_modification_time
+
+
+CONTRACT_BECH32 = "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t"
+CONTRACT_ADDRESS = Address(
+    bytes.fromhex("000000000000000005006ec158c2623717d9b580ca4c891ca3d26f451d856ba7"),
+    "erd",
+)
+
+
+def test_bech32_roundtrip():
+    # Given
+    # When
+    address = Address.from_bech32(CONTRACT_BECH32)
+
+    # Then
+    assert address.pubkey == CONTRACT_ADDRESS.pubkey
+    assert CONTRACT_ADDRESS.bech32() == CONTRACT_BECH32
 
 
 @pytest.mark.parametrize(
     "address_str, expected_result",
     [
-        (
-            "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t",
-            Address.from_bech32(
-                "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t",
-            ),
-        ),
-        (
-            "%my_test_contract.address",
-            Address.from_bech32(
-                "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t",
-            ),
-        ),
-        (
-            "my_test_contract",
-            Address.from_bech32(
-                "erd1qqqqqqqqqqqqqpgqdmq43snzxutandvqefxgj89r6fh528v9dwnswvgq9t",
-            ),
-        ),
+        (CONTRACT_BECH32, CONTRACT_ADDRESS),
+        ("%my_test_contract.address", CONTRACT_ADDRESS),
+        ("my_test_contract", CONTRACT_ADDRESS),
     ],
 )
 def test_get_address_instance(address_str: str, expected_result: Address):
@@ -33,3 +39,29 @@ def test_get_address_instance(address_str: str, expected_result: Address):
     result = get_address_instance(address_str)
     # Then
     assert expected_result.bech32() == result.bech32()
+
+
+def test_cache_by_modification_time(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    # Given
+    file_path = tmp_path / "data.txt"
+    file_path.write_text("first", encoding="utf-8")
+    loaded_paths = []
+
+    @cache_by_modification_time(maxsize=8)
+    def load_file(path: Path) -> str:
+        loaded_paths.append(path)
+        return path.read_text(encoding="utf-8")
+
+    # When
+    monkeypatch.chdir(tmp_path)
+    first_content = load_file(file_path)
+    relative_content = load_file(Path("data.txt"))
+    file_path.write_text("second", encoding="utf-8")
+    modification_time = file_path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(file_path, ns=(modification_time, modification_time))
+    second_content = load_file(file_path)
+
+    # Then
+    assert first_content == relative_content == "first"
+    assert second_content == "second"
+    assert loaded_paths == [file_path.resolve(), file_path.resolve()]